@@ -24,6 +24,7 @@ examples = """Examples:
 view_pdf.py pdf_file.txt
 view_pdf.py pdf_file.txt --show-confidence --confidence-limits 0.9545 --confidence-methods IQR
 view_pdf.py pdf_file.txt -o pdf_fig.png --no-show
+view_pdf.py pdf_file.txt -o pdf_fig.svg --no-show
 """
 
 def create_parser():
@@ -114,8 +115,10 @@ def main():
     # Save figure to file
     if inps.outname is not None:
         # Check output filename
-        if inps.outname[-4:] != ".png":
-            raise ValueError("File output name must end in .png")
+        if not inps.outname.lower().endswith((".png", ".pdf", ".svg")):
+            raise ValueError(
+                "File output name must end in .png, .pdf, or .svg"
+            )
 
         # Save figure
         pdf_fig.savefig(inps.outname)
@@ -86,13 +86,12 @@ def main():
     # Loop through PDFs in config file
     for pdf_name, pdf_spec in pdf_specs.items():
         # Check that a PDF file is specified
-        if "pdf file" not in pdf_spec.keys():
+        pdf_fname = pdf_spec.get("pdf file")
+        if pdf_fname is None:
             raise ValueError("A file name must be associated with each PDF")
 
         # Read PDF from file
-        pdf = PDFs.readers.read_pdf(
-            pdf_spec.get("pdf file"), verbose=inps.verbose
-        )
+        pdf = PDFs.readers.read_pdf(pdf_fname, verbose=inps.verbose)
 
         # Scale PDF units
         pdfs[pdf_name] = units.scale_pdf_by_units(
@@ -103,10 +102,9 @@ def main():
         colors[pdf_name] = pdf_spec.get("color", "black")
 
         # Read prior if specified
-        if pdf_spec.get("prior") is not None:
-            prior = PDFs.readers.read_pdf(
-                pdf_spec.get("prior"), verbose=inps.verbose
-            )
+        prior_fname = pdf_spec.get("prior")
+        if prior_fname is not None:
+            prior = PDFs.readers.read_pdf(prior_fname, verbose=inps.verbose)
 
             # Scale prior units
             priors[pdf_name] = units.scale_pdf_by_units(
@@ -7,32 +7,56 @@
 Define a method for integrating a probability density function that is
 uniform across this library.
 This can conveniently be changed as Python, NumPy, or SciPy update.
+The trapezoid rule is written directly in NumPy, which avoids the argument
+handling of the equivalent SciPy routines for the 1-D arrays used here.
 """
 
 # Import modules
 import numpy as np
-import scipy as sp
 
 
 #################### INTEGRATION METHODS ####################
+def trapezoid_areas(
+    *,
+    x: np.ndarray,
+    px: np.ndarray,
+    dx: np.ndarray | None = None,
+) -> np.ndarray:
+    """Compute the area of each trapezoid between successive samples.
+    The sample spacing (dx) may be provided if already known.
+    """
+    areas = px[1:] + px[:-1]
+    areas *= np.diff(x) if dx is None else dx
+    areas /= 2
+
+    return areas
+
+
 def integrate(
     *,
     x: np.ndarray,
     px: np.ndarray,
+    dx: np.ndarray | None = None,
 ) -> float:
     """Compute the probability mass over the defined domain.
     """
-    return sp.integrate.trapezoid(px, x)
+    return trapezoid_areas(x=x, px=px, dx=dx).sum()
 
 
 def integrate_cumulative(
     *,
     x: np.ndarray,
     px: np.ndarray,
+    dx: np.ndarray | None = None,
 ) -> np.ndarray:
     """Compute the cumulative integral over the defined domain.
     """
-    return sp.integrate.cumulative_trapezoid(px, x, initial=0)
+    # Cumulative sum of trapezoid areas, starting from zero
+    Px = np.empty(len(px))
+    Px[0] = 0.0
+    np.cumsum(trapezoid_areas(x=x, px=px, dx=dx), out=Px[1:])
+
+    return Px
 
 
-# end of file
\ No newline at end of file
+# end of file
@@ -14,11 +14,17 @@ import warnings
 import copy
 
 from .. import (
+    constants,
     units,
     probability_functions as PDFs,
 )
 
 
+# Unit strings already confirmed to have the appropriate base unit
+_VALIDATED_AGE_UNITS: set[str] = set()
+_VALIDATED_DISP_UNITS: set[str] = set()
+
+
 #################### DATED MARKER ####################
 class DatedMarker:
     """A DatedMarker stores the pair of displacement-age values that
@@ -65,10 +71,15 @@ class DatedMarker:
         # Check units
         self._check_units_()
 
+        # Cache of analytics results, stored by variable, function, and args
+        self._analytics_cache = {}
+
 
     def _check_units_(self):
         """Check that the age measurement is some multiple of years,
         and the displacement unit is some multiple of meters.
+        Unit strings that pass are recorded, so repeated units are only
+        parsed once.
         """
         # Check age
         if self.age.unit is None:
@@ -77,10 +88,12 @@ class DatedMarker:
                 "It is highly recommended to specify units.",
                 stacklevel=2,
             )
-        else:
+        elif self.age.unit not in _VALIDATED_AGE_UNITS:
             if units.check_pdf_base_unit(self.age) != 'y':
                 raise ValueError("Age base unit must be y")
 
+            _VALIDATED_AGE_UNITS.add(self.age.unit)
+
         # Check displacement
         if self.displacement.unit is None:
             warnings.warn(
@@ -88,10 +101,117 @@ class DatedMarker:
                 "It is highly recommended to specify units.",
                 stacklevel=2,
             )
-        else:
+        elif self.displacement.unit not in _VALIDATED_DISP_UNITS:
             if units.check_pdf_base_unit(self.displacement) != 'm':
                 raise ValueError("Displacement base unit must be m")
 
+            _VALIDATED_DISP_UNITS.add(self.displacement.unit)
+
+
+    def _get_variable_pdf_(self, variable: str) -> PDFs.PDF:
+        """Retrieve the age or displacement PDF by variable name.
+        """
+        if variable not in ("age", "displacement"):
+            raise ValueError(
+                f"Variable must be age or displacement, got {variable}"
+            )
+
+        return getattr(self, variable)
+
+
+    def _compute_analytic_(self, variable: str, fcn, *args):
+        """Compute an analytic of the age or displacement PDF, or retrieve
+        the value from the cache if it has already been computed.
+        The cached value is recomputed if the PDF has been replaced.
+        """
+        # Retrieve PDF
+        pdf = self._get_variable_pdf_(variable)
+
+        # Check cache
+        key = (variable, fcn.__name__, *args)
+        cached = self._analytics_cache.get(key)
+
+        # Compute value if not cached
+        if cached is None or cached[0] is not pdf:
+            cached = (pdf, fcn(pdf, *args))
+            self._analytics_cache[key] = cached
+
+        return cached[1]
+
+
+    def mean(self, variable: str) -> float:
+        """Mean of the age or displacement PDF.
+
+        Args    variable - str, age or displacement
+        Returns mean - float, mean of PDF
+        """
+        return self._compute_analytic_(variable, PDFs.analytics.pdf_mean)
+
+
+    def mode(self, variable: str) -> float:
+        """Mode of the age or displacement PDF.
+
+        Args    variable - str, age or displacement
+        Returns mode - float, mode of PDF
+        """
+        return self._compute_analytic_(variable, PDFs.analytics.pdf_mode)
+
+
+    def median(self, variable: str) -> float:
+        """Median of the age or displacement PDF.
+
+        Args    variable - str, age or displacement
+        Returns median - float, median of PDF
+        """
+        return self._compute_analytic_(variable, PDFs.analytics.pdf_median)
+
+
+    def std(self, variable: str) -> float:
+        """Standard deviation of the age or displacement PDF.
+
+        Args    variable - str, age or displacement
+        Returns sigma - float, standard deviation of PDF
+        """
+        return self._compute_analytic_(variable, PDFs.analytics.pdf_std)
+
+
+    def interquantile_range(
+        self,
+        variable: str,
+        confidence: float = constants.Psigma["1"],
+    ) -> PDFs.analytics.ConfidenceRange:
+        """Interquantile range of the age or displacement PDF.
+
+        Args    variable - str, age or displacement
+                confidence - float, confidence level
+        Returns conf_range - ConfidenceRange
+        """
+        return self._compute_analytic_(
+            variable, PDFs.analytics.compute_interquantile_range, confidence
+        )
+
+
+    def confidence_range(
+        self,
+        variable: str,
+        metric: str,
+        confidence: float = constants.Psigma["1"],
+    ) -> PDFs.analytics.ConfidenceRange:
+        """Confidence range of the age or displacement PDF, using the
+        specified confidence metric.
+
+        Args    variable - str, age or displacement
+                metric - str, confidence metric to use
+                confidence - float, confidence level
+        Returns conf_range - ConfidenceRange
+        """
+        return self._compute_analytic_(
+            variable,
+            PDFs.analytics.compute_pdf_confidence_range,
+            metric,
+            confidence,
+        )
+
 
     def __str__(self):
         print_str = f"DatedMarker {self.displacement.name}, comprising:"
@@ -99,16 +219,16 @@ class DatedMarker:
         # Report age
         print_str += (
             f"\n\tage: {self.age.name} "
-            f"{PDFs.analytics.pdf_mode(self.age)} "
-            f"+- {PDFs.analytics.pdf_std(self.age):.2f} "
+            f"{self.mode('age')} "
+            f"+- {self.std('age'):.2f} "
             f"{self.age.unit}"
         )
 
         # Report displacement
         print_str += (
             f"\n\tdisplacement: {self.displacement.name} "
-            f"{PDFs.analytics.pdf_mode(self.displacement)} "
-            f"+- {PDFs.analytics.pdf_std(self.displacement):.2f} "
+            f"{self.mode('displacement')} "
+            f"+- {self.std('displacement'):.2f} "
             f"{self.displacement.unit}"
         )
 
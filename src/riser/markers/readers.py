@@ -9,6 +9,19 @@ __all__ = [
 ]
 
 
+# Constants
+# Optional marker metadata entries and the corresponding
+# initialize_marker_from_files arguments
+MARKER_METADATA_KEYS = {
+    "age name": "age_name",
+    "age variable type": "age_variable_type",
+    "age unit": "age_unit",
+    "displacement name": "displacement_name",
+    "displacement variable type": "displacement_variable_type",
+    "displacement unit": "displacement_unit",
+}
+
+
 # Import modules
 import warnings
 
@@ -155,52 +168,52 @@ def read_markers_from_config(
                 f"Displacement file must be specified for marker {marker_name}"
             )
 
+        # Retrieve optional metadata
+        metadata = {
+            kwarg: marker_spec.get(spec_key)
+            for spec_key, kwarg in MARKER_METADATA_KEYS.items()
+        }
+
         # Initialize marker
         marker = initialize_marker_from_files(
             marker_name=marker_name,
             age_fname=age_fname,
             displacement_fname=displacement_fname,
-            age_name=marker_spec.get("age name"),
-            age_variable_type=marker_spec.get("age variable type"),
-            age_unit=marker_spec.get("age unit"),
-            displacement_name=marker_spec.get("displacement name"),
-            displacement_variable_type=marker_spec.get(
-                "displacement variable type"),
-            displacement_unit=marker_spec.get("displacement unit"),
             verbose=verbose,
+            **metadata,
         )
 
         # Write marker to dictionary
         markers[marker_name] = marker
 
     # Check that markers are ordered youngest/smallest to oldest/largest
-    for i, marker in enumerate(markers.values()):
-        if i > 0:
-            # Compute reference age/displacement
-            ref_age = PDFs.analytics.pdf_mean(ref_marker.age)
-            ref_disp = PDFs.analytics.pdf_mean(ref_marker.displacement)
-
-            # Compute marker age/displacement
-            marker_age = PDFs.analytics.pdf_mean(marker.age)
-            marker_disp = PDFs.analytics.pdf_mean(marker.displacement)
-
-            # Check that marker is older/larger than previous
-            if marker_age < ref_age:
-                warnings.warn(
-                    f"Marker {marker.name} appears to be younger than "
-                    f"{ref_marker.name}. Confirm marker order.",
-                    stacklevel=3,
-                )
-
-            if marker_disp < ref_disp:
-                warnings.warn(
-                    f"Marker {marker.name} appears to be less displaced than "
-                    f"{ref_marker.name}. Confirm marker order.",
-                    stacklevel=3,
-                )
-
-        # Update reference marker
-        ref_marker = marker
+    marker_list = [*markers.values()]
+
+    # Compute marker ages/displacements
+    ages = PDFs.analytics.pdf_means([marker.age for marker in marker_list])
+    disps = PDFs.analytics.pdf_means(
+        [marker.displacement for marker in marker_list]
+    )
+
+    for i in range(1, len(marker_list)):
+        # Reference and current markers
+        ref_marker = marker_list[i-1]
+        marker = marker_list[i]
+
+        # Check that marker is older/larger than previous
+        if ages[i] < ages[i-1]:
+            warnings.warn(
+                f"Marker {marker.name} appears to be younger than "
+                f"{ref_marker.name}. Confirm marker order.",
+                stacklevel=3,
+            )
+
+        if disps[i] < disps[i-1]:
+            warnings.warn(
+                f"Marker {marker.name} appears to be less displaced than "
+                f"{ref_marker.name}. Confirm marker order.",
+                stacklevel=3,
+            )
 
     return markers
 
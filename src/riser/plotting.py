@@ -17,20 +17,32 @@ __all__ = [
     "plot_cdf_labeled",
     "plot_filter_kernel",
     "set_origin_zero",
+    "axis_labels_from_markers",
+    "format_marker_plot",
+    "plot_marker_whisker",
+    "plot_markers_whisker",
+    "plot_marker_rectangle",
+    "plot_markers_rectangle",
+    "plot_markers_joint_pdf",
     "plot_markers",
     "plot_mc_picks",
 ]
 
 
 # Import modules
+from functools import lru_cache, partial
+
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.lines import Line2D
 from matplotlib.patches import Rectangle
+from matplotlib.collections import (
+    LineCollection,
+    PatchCollection,
+    PolyCollection,
+)
 
 from . import (
     constants,
-    units,
-    variable_types,
     probability_functions as PDFs,
 )
 from .sampling import filtering
@@ -38,8 +50,11 @@ from .markers import DatedMarker
 
 
 #################### GENERAL LABELING ####################
+@lru_cache(maxsize=None)
 def formulate_axis_label(variable_type: str, unit: str) -> str:
     """Formulate an axis label in a standardized manner.
+    Labels depend only on the metadata strings, so each combination is
+    formulated once and reused.
 
     Args    pdf - PDF from which to draw the metadata
     Returns ax_label - str, standardized axis label
@@ -70,22 +85,73 @@ def axis_label_from_pdf(pdf: PDFs.PDF) -> str:
     return formulate_axis_label(variable_type, unit)
 
 
+def common_pdf_metadata(
+    pdfs: list[PDFs.PDF]
+) -> tuple[str | None, str | None]:
+    """Determine the variable type and unit common to a series of PDFs in a
+    single pass.
+    Equivalent to variable_types.check_same_pdf_variable_types and
+    units.check_same_pdf_units, without traversing the PDFs twice.
+
+    Args    pdfs - list[PDF], PDFs to check
+    Returns variable_type - str|None, common variable type, if any
+            unit - str|None, common unit, if any
+    """
+    # Establish initial metadata
+    variable_type = pdfs[0].variable_type
+    unit = pdfs[0].unit
+
+    # Loop through all PDFs
+    for pdf in pdfs[1:]:
+        # Nullify metadata that differ from the initial values
+        if pdf.variable_type != variable_type:
+            variable_type = None
+
+        if pdf.unit != unit:
+            unit = None
+
+        # Stop once neither item is common
+        if variable_type is None and unit is None:
+            break
+
+    return variable_type, unit
+
+
 def axis_label_from_pdfs(pdfs: list[PDFs.PDF]) -> str:
     """Formulate an axis label from PDF metadata in a standardized manner.
 
     Args    pdfs - list[PDF], PDFs from which to draw the metadata
     Returns ax_label - str, standardized axis label
     """
-    # Set variable type
-    variable_type = variable_types.check_same_pdf_variable_types(pdfs)
-
-    # Set unit
-    unit = units.check_same_pdf_units(pdfs)
+    # Set variable type and unit
+    variable_type, unit = common_pdf_metadata(pdfs)
 
     return formulate_axis_label(variable_type, unit)
 
 
 #################### PDF PLOTTING ####################
+def scale_probability_density(
+    px: np.ndarray, scale: float = 1.0, offset: float = 0.0
+) -> np.ndarray:
+    """Scale and shift probability density values for plotting.
+    The offset is added in place, so only one new array is allocated.
+    Unscaled, unshifted values are returned as is, without a copy.
+
+    Args    px - np.ndarray, probability density values
+            scale - float, y-axis scale
+            offset - float, y-axis offset
+    Returns y - np.ndarray, scaled and shifted values
+    """
+    # Return original values if no scaling or shift is applied
+    if scale == 1 and offset == 0:
+        return px
+
+    y = np.multiply(px, scale)
+    np.add(y, offset, out=y)
+
+    return y
+
+
 def plot_pdf_line(
     ax,
     pdf: PDFs.PDF,
@@ -97,7 +163,7 @@ def plot_pdf_line(
     # Scaling args
     offset: float = 0.0,
     scale: float = 1.0
-) -> None:
+) -> Line2D:
     """Basic line plot of a probability density function (PDF).
 
     Args    ax - pyplot axis
@@ -107,17 +173,20 @@ def plot_pdf_line(
             zorder - int, position on plot
             offset - float, y-axis offset
             scale - float, y-axis scale
+    Returns line - Line2D, PDF line artist
     """
     # Plot PDF
-    ax.plot(
+    line, = ax.plot(
         pdf.x,
-        scale * pdf.px + offset,
+        scale_probability_density(pdf.px, scale, offset),
         color=color,
         linewidth=linewidth,
         zorder=zorder,
         label=pdf.name,
     )
 
+    return line
+
 
 def plot_pdf_filled(
     ax,
@@ -128,33 +197,44 @@ def plot_pdf_filled(
     linewidth: float = 2.0,
     zorder: int = 1,
     alpha: float = 0.3,
+    rasterized: bool = True,
     # Scaling args
     offset: float = 0.0,
     scale: float = 1.0,
-) -> None:
+) -> tuple[PolyCollection, Line2D]:
     """Filled plot of a probability density function (PDF).
+    The fill is rasterized by default; set rasterized to False to keep it as
+    a vector path.
+
+    Returns fill - PolyCollection, filled PDF artist
+            line - Line2D, PDF outline artist
     """
+    # Scaled probability density values
+    y = scale_probability_density(pdf.px, scale, offset)
+
     # Plot filled PDF
-    ax.fill_between(
+    fill = ax.fill_between(
         pdf.x,
-        scale * pdf.px + offset,
+        y,
         y2=offset,
         color=color,
         zorder=zorder,
         alpha=alpha,
+        rasterized=rasterized,
     )
 
     # Plot PDF outline
-    plot_pdf_line(
-        ax,
-        pdf,
+    line, = ax.plot(
+        pdf.x,
+        y,
         color=color,
         linewidth=linewidth,
         zorder=zorder,
-        offset=offset,
-        scale=scale,
+        label=pdf.name,
     )
 
+    return fill, line
+
 
 def plot_pdf_labeled(
     ax,
@@ -209,13 +289,19 @@ def plot_pdf_confidence_range(
     # Style args
     color: str = "royalblue",
     zorder: int = 1,
-    alpha: float = 0.3,
+    alpha: float = 0.5,
     incl_label: bool = False,
+    rasterized: bool = True,
     # Scaling args
     offset: float = 0.0,
     scale: float = 1.0,
-) -> None:
+) -> PolyCollection:
     """Plot confidence ranges as fields overlying a PDF.
+    All ranges are drawn as a single artist.
+    The fields are rasterized by default; set rasterized to False to keep
+    them as vector paths.
+
+    Returns fill - PolyCollection, with one polygon per range
     """
     # Formulate label
     label = (
@@ -223,21 +309,34 @@ def plot_pdf_confidence_range(
         else None
     )
 
+    # Scale probability density values once for all ranges
+    y = scale_probability_density(pdf.px, scale, offset)
+
+    # Indices bounding each range, found for all ranges at once - value
+    # array is strictly increasing
+    rng_vals = np.asarray(conf_range.range_values, dtype=float).reshape(-1, 2)
+    i_starts = np.searchsorted(pdf.x, rng_vals[:,0], side="left")
+    i_ends = np.searchsorted(pdf.x, rng_vals[:,1], side="right")
+
+    # Flag values within any range
+    in_range = np.zeros(len(pdf), dtype=bool)
+    for i_start, i_end in zip(i_starts, i_ends):
+        in_range[i_start:i_end] = True
+
     # Plot confidence ranges
-    for rng in conf_range:
-        # Indices within range
-        rng_ndx = (pdf.x >= rng[0]) & (pdf.x <= rng[1])
-
-        # Plot range
-        ax.fill_between(
-            pdf.x[rng_ndx],
-            y1=scale * pdf.px[rng_ndx] + offset,
-            y2=offset,
-            color=color,
-            zorder=zorder,
-            alpha=0.5,
-            label=label
-        )
+    fill = ax.fill_between(
+        pdf.x,
+        y1=y,
+        y2=offset,
+        where=in_range,
+        color=color,
+        zorder=zorder,
+        alpha=alpha,
+        label=label,
+        rasterized=rasterized,
+    )
+
+    return fill
 
 
 # Multi-PDF
@@ -249,16 +348,22 @@ def plot_pdf_stack(
     conf_ranges: dict | None = None,
     priors: dict | None = None,
     same_height: bool | None = False,
-) -> None:
+) -> dict[str, dict]:
     """Plot multiple PDFs as rows on the same figure.
     Check all PDFs for the maximum px value, scale the largest max to 1.0,
     and scale the other PDF maxima accordingly.
 
+    The artists are returned so that interactive callers can update them in
+    place and blit, rather than redrawing the whole stack, e.g.,
+        line.set_ydata(new_y); ax.draw_artist(line); fig.canvas.blit(ax.bbox)
+
     Args    ax - axis on which to plot
             pdfs - dict, PDFs stored by PDF name
             conf_ranges - dict, ConfidenceRanges stored by PDF name
             height - float, height of hightest PDF peak relative to line
                 spacing
+    Returns artists - dict, with entries "lines", "fills", "priors", and
+                "conf", each a dict of artists stored by PDF name
     """
     # Set defaults
     if colors is None:
@@ -270,58 +375,65 @@ def plot_pdf_stack(
     if priors is None:
         priors = {}
 
-    # Determine highest peak
-    max_peak = 0
-    for pdf in pdfs.values():
-        px_max = pdf.px.max()
-        max_peak = px_max if px_max > max_peak else max_peak
+    # Align per-PDF style inputs with the stack order
+    names = [*pdfs.keys()]
+    color_list = [colors.get(name, "black") for name in names]
+    prior_list = [priors.get(name) for name in names]
+    conf_list = [conf_ranges.get(name) for name in names]
+
+    # Determine PDF peaks and scale factors
+    peaks = np.fromiter(
+        (pdf.px_max for pdf in pdfs.values()), dtype=float, count=len(pdfs)
+    )
+    if same_height:
+        scales = height / peaks
+    else:
+        scales = np.full(len(pdfs), height / peaks.max())
+
+    # Bind plotting arguments that are the same for every row
+    plot_prior = partial(plot_pdf_line, ax, color="darkgrey", zorder=3)
+    plot_pdf = partial(plot_pdf_filled, ax, zorder=2)
+    plot_conf = partial(plot_pdf_confidence_range, ax, zorder=1)
+
+    # Empty dictionaries to store artists
+    artists = {
+        "lines": {},
+        "fills": {},
+        "priors": {},
+        "conf": {},
+    }
 
     # Loop through PDFs
-    for i, (name, pdf) in enumerate(pdfs.items()):
-        # Determine scale
-        if same_height:
-            scale = height / pdf.px.max()
-        else:
-            scale = height / max_peak
+    for i, (name, pdf, color, prior, conf_range) in enumerate(
+        zip(names, pdfs.values(), color_list, prior_list, conf_list)
+    ):
+        scale = scales[i]
 
         # Plot prior if available
-        if priors.get(name) is not None:
-            plot_pdf_line(
-                ax,
-                priors.get(name),
-                color="darkgrey",
-                zorder=3,
-                offset=i,
-                scale=scale,
+        if prior is not None:
+            artists["priors"][name] = plot_prior(
+                prior, offset=i, scale=scale
             )
 
         # Plot PDF
-        plot_pdf_filled(
-            ax,
-            pdf,
-            color=colors.get(name, "black"),
-            zorder=2,
-            offset=i,
-            scale=scale,
+        artists["fills"][name], artists["lines"][name] = plot_pdf(
+            pdf, color=color, offset=i, scale=scale
         )
 
         # Plot confidence range if available
-        if conf_ranges.get(name) is not None:
-            plot_pdf_confidence_range(
-                ax,
-                pdf,
-                conf_range=conf_ranges.get(name),
-                zorder=1,
-                offset=i,
-                scale=scale,
+        if conf_range is not None:
+            artists["conf"][name] = plot_conf(
+                pdf, conf_range=conf_range, offset=i, scale=scale
             )
 
     # Format plot
     ax.set_xlabel(axis_label_from_pdfs([*priors.values()] + [*pdfs.values()]))
     ax.set_yticks(range(len(pdfs)))
-    ax.set_yticklabels([*pdfs.keys()])
+    ax.set_yticklabels(names)
     ax.set_ylabel("Rel probability density")
 
+    return artists
+
 
 #################### CDF PLOTTING ####################
 def plot_cdf_line(
@@ -352,8 +464,11 @@ def plot_cdf_filled(
     color: str = "black",
     linewidth: float = 2.0,
     alpha: float = 0.3,
+    rasterized: bool = True,
 ) -> None:
     """Filled plot of a cumulative distribution function (CDF).
+    The fill is rasterized by default; set rasterized to False to keep it as
+    a vector path.
     """
     # Plot filled PDF
     ax.fill_between(
@@ -361,6 +476,7 @@ def plot_cdf_filled(
         pdf.Px,
         color=color,
         alpha=alpha,
+        rasterized=rasterized,
     )
 
     # Plot PDF outline
@@ -419,20 +535,25 @@ def plot_filter_kernel(ax, filt: filtering.FIRFilter) -> None:
 #################### DATED MARKER PLOTTING ####################
 def set_origin_zero(ax) -> None:
     """Set the plot origin at zero.
+    Only the lower limits are set, so the upper limits are left as they are.
     """
-    ax.set_xlim([0, ax.get_xlim()[1]])
-    ax.set_ylim([0, ax.get_ylim()[1]])
+    ax.set_xlim(left=0)
+    ax.set_ylim(bottom=0)
 
 
-def format_marker_plot(ax, markers: DatedMarker|dict) -> None:
-    """Add axis labels, formulated in the standardized manner.
+def axis_labels_from_markers(markers: DatedMarker|dict) -> tuple[str, str]:
+    """Formulate age and displacement axis labels from marker metadata in a
+    standardized manner.
+
+    Args    markers - DatedMarker or dict of DatedMarkers
+    Returns xlabel, ylabel - str, standardized axis labels
     """
-    if type(markers) == DatedMarker:
+    if isinstance(markers, DatedMarker):
         # Axis labels based on single marker
         xlabel = axis_label_from_pdf(markers.age)
         ylabel = axis_label_from_pdf(markers.displacement)
 
-    elif type(markers) == dict:
+    elif isinstance(markers, dict):
         # Axis labels based on multiple markers
         xlabel = axis_label_from_pdfs(
                 [marker.age for marker in markers.values()])
@@ -443,6 +564,15 @@ def format_marker_plot(ax, markers: DatedMarker|dict) -> None:
         raise Exception("Markers must be passed as a single DatedMarker "
                         "or dictionary of DatedMarkers")
 
+    return xlabel, ylabel
+
+
+def format_marker_plot(ax, markers: DatedMarker|dict) -> None:
+    """Add axis labels, formulated in the standardized manner.
+    """
+    # Formulate labels
+    xlabel, ylabel = axis_labels_from_markers(markers)
+
     # Label axes
     ax.set_xlabel(xlabel)
     ax.set_ylabel(ylabel)
@@ -459,35 +589,17 @@ def plot_marker_whisker(
     label: bool = False,
 ) -> None:
     """Plot a dated marker as a cross.
+    Uses the same single-call errorbar path as plot_markers_whisker.
     """
-    # Compute age confidence limits
-    age_median = PDFs.analytics.pdf_median(marker.age)
-    age_range = PDFs.analytics.compute_interquantile_range(
-            marker.age, confidence
+    plot_markers_whisker(
+        ax,
+        {marker.name: marker},
+        confidence,
+        color=color,
+        zorder=zorder,
+        label=label,
     )
 
-    # Plot age values (first and only cluster range)
-    age_vals = age_range.range_values[0]
-    age_err = [[age_median - age_vals[0]], [age_vals[1] - age_median]]
-
-    # Compute displacement confidence limits
-    disp_median = PDFs.analytics.pdf_median(marker.displacement)
-    disp_range = PDFs.analytics.compute_interquantile_range(
-            marker.displacement, confidence
-    )
-
-    # Plot displacement values (first and only cluster range)
-    disp_vals = disp_range.range_values[0]
-    disp_err = [[disp_median - disp_vals[0]], [disp_vals[1] - disp_median]]
-
-    # Plot marker
-    ax.errorbar(age_median, disp_median, xerr=age_err, yerr=disp_err,
-                color=color, zorder=zorder)
-
-    # Label if requested
-    if label:
-        ax.text(1.01 * age_median, 1.01 * disp_median, marker.name)
-
 
 def plot_markers_whisker(
     ax,
@@ -499,16 +611,45 @@ def plot_markers_whisker(
     zorder = 1,
     label: bool = False,
 ) -> None:
-    """Plot a dated marker as a cross.
+    """Plot dated markers as crosses.
+    All markers are drawn with a single errorbar call.
     """
-    for marker in markers.values():
-        plot_marker_whisker(
-            ax=ax,
-            marker=marker,
-            color=color,
-            zorder=zorder,
-            label=label,
+    # Gather medians and confidence limits (first and only cluster range)
+    # in a single pass over the markers - one row per marker
+    stats = np.array([
+        (
+            marker.median("age"),
+            marker.median("displacement"),
+            *marker.interquantile_range("age", confidence).range_values[0],
+            *marker.interquantile_range(
+                "displacement", confidence
+            ).range_values[0],
         )
+        for marker in markers.values()
+    ])
+    age_medians = stats[:,0]
+    disp_medians = stats[:,1]
+    age_vals = stats[:,2:4]
+    disp_vals = stats[:,4:6]
+
+    # Error bar lengths below and above the medians
+    age_err = np.vstack(
+        [age_medians - age_vals[:,0], age_vals[:,1] - age_medians]
+    )
+    disp_err = np.vstack(
+        [disp_medians - disp_vals[:,0], disp_vals[:,1] - disp_medians]
+    )
+
+    # Plot markers
+    ax.errorbar(age_medians, disp_medians, xerr=age_err, yerr=disp_err,
+                fmt="none", color=color, zorder=zorder)
+
+    # Label if requested
+    if label:
+        for marker, age_median, disp_median in zip(
+            markers.values(), age_medians, disp_medians
+        ):
+            ax.text(1.01 * age_median, 1.01 * disp_median, marker.name)
 
 
 def plot_marker_rectangle(
@@ -522,11 +663,11 @@ def plot_marker_rectangle(
     label: bool = False,
 ) -> None:
     """Plot a dated marker as a rectangle.
+    Axis limits are left to autoscaling; use set_origin_zero to anchor the
+    plot at the origin.
     """
     # Compute age confidence limits
-    age_range = PDFs.analytics.compute_interquantile_range(
-            marker.age, confidence
-    )
+    age_range = marker.interquantile_range("age", confidence)
 
     # Plot age values (first and only cluster range)
     age_vals = age_range.range_values[0]
@@ -534,9 +675,7 @@ def plot_marker_rectangle(
     box_width = age_vals[1] - box_x
 
     # Compute displacement confidence limits
-    disp_range = PDFs.analytics.compute_interquantile_range(
-            marker.displacement, confidence
-    )
+    disp_range = marker.interquantile_range("displacement", confidence)
 
     # Plot displacement values (first and only cluster range)
     disp_vals = disp_range.range_values[0]
@@ -554,15 +693,12 @@ def plot_marker_rectangle(
             zorder=zorder,
         )
     )
+    ax.autoscale_view()
 
     # Label if requested
     if label:
         ax.text(age_vals[1], disp_vals[1], marker.name)
 
-    # Adjust axis limits
-    ax.set_xlim([0, 1.1 * age_vals[1]])
-    ax.set_ylim([0, 1.1 * disp_vals[1]])
-
 
 def plot_markers_rectangle(
     ax,
@@ -575,16 +711,48 @@ def plot_markers_rectangle(
     label: bool = False,
 ) -> None:
     """Plot dated markers as rectangles.
+    All rectangles are drawn as a single PatchCollection.
     """
-    for marker in markers.values():
-        plot_marker_rectangle(
-            ax=ax,
-            marker=marker,
-            confidence=confidence,
-            color=color,
+    # Gather confidence limits (first and only cluster range) in a single
+    # pass over the markers - one row per marker
+    bounds = np.array([
+        (
+            *marker.interquantile_range("age", confidence).range_values[0],
+            *marker.interquantile_range(
+                "displacement", confidence
+            ).range_values[0],
+        )
+        for marker in markers.values()
+    ])
+    age_vals = bounds[:,0:2]
+    disp_vals = bounds[:,2:4]
+
+    # Form rectangles
+    boxes = [
+        Rectangle((age_min, disp_min), age_max - age_min, disp_max - disp_min)
+        for (age_min, age_max), (disp_min, disp_max) in zip(age_vals, disp_vals)
+    ]
+
+    # Plot rectangles
+    ax.add_collection(
+        PatchCollection(
+            boxes,
+            edgecolor=color,
+            facecolor="none",
             zorder=zorder,
-            label=label,
         )
+    )
+
+    # Label if requested
+    if label:
+        for marker, (_, age_max), (_, disp_max) in zip(
+            markers.values(), age_vals, disp_vals
+        ):
+            ax.text(age_max, disp_max, marker.name)
+
+    # Adjust axis limits once for all markers
+    ax.set_xlim([0, 1.1 * age_vals[:,1].max()])
+    ax.set_ylim([0, 1.1 * disp_vals[:,1].max()])
 
 
 def plot_markers_joint_pdf(
@@ -603,47 +771,53 @@ def plot_markers_joint_pdf(
     """Plot markers as joint PDFs.
     """
     # Determine plot limits based on markers if necessary
+    # Value arrays strictly increase, so the last value is the maximum
     if xmax == 0:
-        for marker in markers.values():
-            # Max age
-            age_max = marker.age.x.max()
-            xmax = age_max if age_max > xmax else xmax
+        xmax = max(marker.age.x[-1] for marker in markers.values())
 
     if ymax == 0:
-        for marker in markers.values():
-            # Max displacement
-            disp_max = marker.displacement.x.max()
-            ymax = disp_max if disp_max > ymax else ymax
-
-    # Establish grid boundaries
-    xmax = marker.age.x.max() if xmax is None else xmax
-    ymax = marker.displacement.x.max() if ymax is None else ymax
+        ymax = max(marker.displacement.x[-1] for marker in markers.values())
 
     # Establish a coarse grid on which to sample
     x = np.linspace(xmin, xmax, n)
     y = np.linspace(ymin, ymax, n)
-    X, Y = np.meshgrid(x, y)
 
-    # Initialize total joing probability
-    Pjoint = np.zeros(X.shape)
+    # Interpolate PDFs on coarse grid - one preallocated row per marker
+    # Single precision is ample for colormapped output, and halves the
+    # memory traffic of the joint probability computation
+    Px = np.empty((len(markers), n), dtype=np.float32)
+    PDFs.interpolation.pdfs_at_value(
+        [marker.age for marker in markers.values()], x, out=Px
+    )
+    Py = np.empty((len(markers), n), dtype=np.float32)
+    PDFs.interpolation.pdfs_at_value(
+        [marker.displacement for marker in markers.values()], y, out=Py
+    )
 
-    # Loop through markers
-    for marker_name, marker in markers.items():
-        # Interpolate PDFs on coarse grid
-        px = marker.age.pdf_at_value(x)
-        py = marker.displacement.pdf_at_value(y)
-
-        # Compute joint probability
-        Pjoint += np.outer(px, py)
-
-        # Label if requested
-        if label:
-            age_mode = PDFs.analytics.pdf_mode(marker.age)
-            disp_mode = PDFs.analytics.pdf_mode(marker.displacement)
+    # Compute total joint probability - sum of outer products over markers
+    # Rows index displacement and columns index age, so the product is
+    # already C-contiguous in the orientation expected by imshow
+    Pjoint = Py.T @ Px
+
+    # Label if requested
+    if label:
+        for marker_name, marker in markers.items():
+            age_mode = marker.mode("age")
+            disp_mode = marker.mode("displacement")
             ax.text(age_mode, disp_mode, marker_name, color="royalblue")
 
-    # Plot joint probability
-    ax.pcolormesh(X, Y, Pjoint.T, cmap=cmap)
+    # Plot joint probability - the grid is regular, so draw it as an image
+    # with cells centered on the grid nodes
+    half_dx = (x[1] - x[0]) / 2
+    half_dy = (y[1] - y[0]) / 2
+    ax.imshow(
+        Pjoint,
+        cmap=cmap,
+        origin="lower",
+        extent=(xmin - half_dx, xmax + half_dx, ymin - half_dy, ymax + half_dy),
+        aspect="auto",
+        interpolation="nearest",
+    )
 
 
 def plot_markers(
@@ -660,6 +834,9 @@ def plot_markers(
 ) -> None:
     """Plot multiple dated markers.
     """
+    # Formulate axis labels once, before plotting
+    xlabel, ylabel = axis_labels_from_markers(markers)
+
     # Arguments common to any plot
     plt_args = {
         "ax": ax,
@@ -667,6 +844,9 @@ def plot_markers(
         "label": label,
     }
 
+    # Whether the origin must be set at zero after plotting
+    zero_origin = True
+
     # Retrieve marker plot
     if marker_plot_type == "whisker":
         # Update plot args
@@ -679,8 +859,9 @@ def plot_markers(
         # Update plot args
         plt_args["confidence"] = confidence
 
-        # Retrieve rectangle plot
+        # Retrieve rectangle plot - sets its own limits starting at zero
         plotter = plot_markers_rectangle
+        zero_origin = False
 
     elif marker_plot_type == "pdf":
         # Update plot args
@@ -703,10 +884,12 @@ def plot_markers(
     plotter(**plt_args)
 
     # Ensure origin set at zero
-    set_origin_zero(ax)
+    if zero_origin:
+        set_origin_zero(ax)
 
     # Label axes
-    format_marker_plot(ax, markers)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
 
     # Set title
     ax.set_title("Displacement-Age History")
@@ -718,26 +901,36 @@ def plot_mc_picks(
     age_picks: np.ndarray,
     disp_picks: np.ndarray,
     max_picks: int = 500,
+    *,
+    rasterized: bool = True,
 ) -> None:
     """Plot valid displacement-age picks.
+    The semi-transparent overlay is rasterized by default, so vector
+    outputs carry one image rather than every segment and marker; set
+    rasterized to False to keep them as vector paths.
     """
-    # Plot lines connecting points
-    ax.plot(
-        age_picks[:,:max_picks],
-        disp_picks[:,:max_picks],
-        color="k",
-        alpha=0.1,
-        zorder=1,
+    # Plot lines connecting points - one segment list per pick
+    segments = np.stack(
+        [age_picks[:,:max_picks].T, disp_picks[:,:max_picks].T], axis=-1
     )
+    ax.add_collection(
+        LineCollection(
+            segments, colors="k", alpha=0.1, zorder=1, rasterized=rasterized
+        )
+    )
+    ax.autoscale_view()
 
-    # Plot pick values
-    ax.scatter(
-        age_picks[:,:max_picks],
-        disp_picks[:,:max_picks],
-        s=2**2,
+    # Plot pick values - markers only, drawn as a single line artist
+    ax.plot(
+        age_picks[:,:max_picks].ravel(),
+        disp_picks[:,:max_picks].ravel(),
+        linestyle="",
+        marker="o",
+        markersize=2,
         color="b",
         alpha=0.1,
         zorder=2,
+        rasterized=rasterized,
     )
 
 
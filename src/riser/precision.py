@@ -7,11 +7,13 @@
 __all__ = [
     "check_precision",
     "fix_precision",
+    "spacing_tolerance",
 ]
 
 
 # Constants
 RISER_PRECISION = 10  # decimals
+RISER_TOLERANCE = 10 ** -RISER_PRECISION
 
 
 # Import modules
@@ -24,7 +26,7 @@ import numpy as np
 def check_precision(x: float) -> float:
     """Check that value is above precision limit.
     """
-    if x <= 10 ** -RISER_PRECISION:
+    if x <= RISER_TOLERANCE:
         warnings.warn(
             "Number is less than optimal precision of the RISeR library"
         )
@@ -36,4 +38,13 @@ def fix_precision(x: float) -> float:
     return np.round(x, RISER_PRECISION)
 
 
+def spacing_tolerance(dx: np.ndarray) -> float:
+    """Tolerance on the spread of sample spacings for a regular grid.
+    Values rounded to RISER_PRECISION decimals (e.g., read from file) carry
+    spacing jitter of up to twice the tolerance, plus a part relative to the
+    mean spacing to cover machine error on large values.
+    """
+    return RISER_TOLERANCE * (2 + np.abs(dx).mean())
+
+
 # end of file
\ No newline at end of file
@@ -10,6 +10,8 @@ __all__ = [
 
 
 # Import modules
+from functools import cached_property
+
 import numpy as np
 
 from .. import precision
@@ -68,8 +70,9 @@ class ProbabilityDensityFunction:
                 variable_type - str, sampled quantity, e.g., age, displacement
                 unit - str, value unit
         """
-        # Ensure domain values are numpy array
-        x = np.array(x, dtype=float)
+        # Ensure domain values are numpy array - read-only arrays, e.g., the
+        # values of another PDF, are shared rather than copied
+        x = self._as_array_(x)
 
         # Check number of domain values
         nx = len(x)
@@ -79,14 +82,19 @@ class ProbabilityDensityFunction:
                 f"got {nx}"
             )
 
-        # Record domain values
+        # Record domain values and sample spacing
         self._x = x
+        self._dx = np.diff(x)
 
         # Check condition 1
         self._check_monotonic_()
 
-        # Ensure probability density values are numpy array
-        px = np.array(px, dtype=float)
+        # Ensure probability density values are numpy array - copy if the
+        # values will be normalized in place
+        px = (
+            np.array(px, dtype=float) if normalize_area
+            else self._as_array_(px)
+        )
 
         # Check number of probability density values
         npx = len(px)
@@ -102,18 +110,19 @@ class ProbabilityDensityFunction:
         # Condition 2: Check non-negative
         self._check_nonnegative_()
 
+        # Compute CDF - the same pass yields the area under the curve
+        self._Px, area = self._compute_cdf_()
+
         # Normalize area under the curve
         if normalize_area:
-            self._normalize_area_()
+            area = self._normalize_area_(area)
 
         # Condition 3: Check PDF area
-        self._check_unit_area_()
-
-        # Compute CDF
-        self._Px = self._compute_cdf_()
+        self._check_unit_area_(area)
 
         # Enforce immutability
         self._x.setflags(write=False)
+        self._dx.setflags(write=False)
         self._px.setflags(write=False)
         self._Px.setflags(write=False)
 
@@ -122,42 +131,67 @@ class ProbabilityDensityFunction:
         self.variable_type = variable_type
         self.unit = unit
 
-    def _compute_area_(self) -> float:
-        return integration.integrate(x=self._x, px=self._px)
-
-    def _normalize_area_(self) -> None:
-        area = self._compute_area_()
+    @staticmethod
+    def _as_array_(values: np.ndarray) -> np.ndarray:
+        """Return values as a float array.
+        Read-only float arrays that own their data are shared rather than
+        copied, so PDFs built on a common value array do not each keep a copy;
+        anything else is copied.
+        The aliasing is intentional: a caller passing a read-only array must
+        not make it writeable and modify it afterwards, as that would change
+        the data of every PDF sharing it.
+        """
+        if (
+            isinstance(values, np.ndarray)
+            and values.dtype == float
+            and values.flags.owndata
+            and not values.flags.writeable
+        ):
+            return values
+
+        return np.array(values, dtype=float)
+
+    def _normalize_area_(self, area: float) -> float:
+        """Scale the probability density values by the area under the curve.
+        Returns the area of the normalized PDF.
+        """
         self._px /= area
+        return 1.0
 
-    def _compute_cdf_(self) -> None:
+    def _compute_cdf_(self) -> tuple[np.ndarray, float]:
         """Compute the cumulative distribution function.
+        The final value of the cumulative integral is the area under the
+        curve, which is returned alongside the CDF.
         """
         # Cumulative integration
-        Px = integration.integrate_cumulative(x=self._x, px=self._px)
+        Px = integration.integrate_cumulative(
+            x=self._x, px=self._px, dx=self._dx
+        )
+
+        # Area under the curve
+        area = Px[-1]
 
         # Normalize final value to 1.0
-        Px /= Px[-1]
+        Px /= area
 
-        return Px
+        return Px, area
 
     def _check_monotonic_(self) -> None:
         """Check condition 1: Domain values increase monotonically.
         """
-        diff_x = np.diff(self._x)
-        if np.any(diff_x <= 0):
+        if np.any(self._dx <= 0):
             raise ValueError("Domain values must strictly increase")
 
     def _check_nonnegative_(self) -> None:
         """Check condition 2: No negative probability density values.
         """
-        if -1 in np.sign(self._px):
+        if np.any(self._px < 0):
             raise ValueError("All probability values must be non-negative")
 
-    def _check_unit_area_(self) -> None:
+    def _check_unit_area_(self, area: float) -> None:
         """Check that the area under the curve is 1.0.
         """
-        area = self._compute_area_()
-        if np.abs(1.0 - area) > precision.RISER_PRECISION:
+        if np.abs(1.0 - area) > precision.RISER_TOLERANCE:
             raise ValueError(
                 f"PDF area should be 1.0, got {area}. "
                 f"Suggest setting `normalize_area` to True."
@@ -168,6 +202,12 @@ class ProbabilityDensityFunction:
     def x(self) -> np.ndarray:
         return self._x
 
+    @property
+    def dx(self) -> np.ndarray:
+        """Spacing between successive domain values (n - 1 values).
+        """
+        return self._dx
+
     @property
     def px(self) -> np.ndarray:
         return self._px
@@ -176,6 +216,37 @@ class ProbabilityDensityFunction:
     def Px(self) -> np.ndarray:
         return self._Px
 
+    @cached_property
+    def bin_widths(self) -> np.ndarray:
+        """Width of the bin represented by each value (n values).
+        The first n - 1 widths are the spacing between successive values.
+        The final width is the mean spacing if the PDF is regularly sampled,
+        or zero if it is irregularly sampled.
+        Values are immutable, so the widths are determined once and reused.
+        """
+        # Check regularity against rounding error - range of spacings
+        if np.ptp(self._dx) > precision.spacing_tolerance(self._dx):
+            # Irregular sampling of PDF
+            widths = np.append(self._dx, 0)
+        else:
+            # Regular sampling - mean spacing from the end values
+            widths = np.append(
+                self._dx, (self._x[-1] - self._x[0]) / (len(self._x) - 1)
+            )
+
+        # Round to compensate for machine error
+        widths = precision.fix_precision(widths)
+        widths.setflags(write=False)
+
+        return widths
+
+    @cached_property
+    def px_max(self) -> float:
+        """Peak probability density.
+        Values are immutable, so the peak is found once and reused.
+        """
+        return float(self._px.max())
+
 
     def pdf_at_value(self, x: float) -> float:
         """Compute the value of the PDF at x.
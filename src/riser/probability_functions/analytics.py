@@ -9,15 +9,18 @@ These functions quantify properities of a random variable.
 
 # Public API
 __all__ = [
+    "integer_power",
     "expected_value",
     "compute_raw_moment",
     "compute_central_moment",
     "compute_standardized_moment",
     "pdf_mean",
+    "pdf_means",
     "pdf_variance",
     "pdf_std",
     "pdf_skewness",
     "pdf_kurtosis",
+    "pdf_moments",
     "pdf_mode",
     "pdf_median",
     "PDFstatistics",
@@ -30,7 +33,6 @@ __all__ = [
 
 # Import modules
 from dataclasses import dataclass
-import copy
 
 import numpy as np
 
@@ -43,6 +45,36 @@ from .ProbabilityDensityFunction import ProbabilityDensityFunction as PDF
 
 
 #################### MOMENTS ####################
+def integer_power(d: np.ndarray, n: int) -> np.ndarray:
+    """Raise values to a non-negative integer power by repeated squaring.
+    For the low powers used in moments, a few multiplications are faster
+    than the general power function.
+
+    Args    d - np.ndarray, values to raise
+            n - int, power, n >= 0
+    Returns d_n - np.ndarray, values raised to the power n
+    """
+    # Check power is valid
+    if n < 0:
+        raise ValueError(f"Power must be a non-negative integer, not {n}")
+
+    # Zeroth power
+    if n == 0:
+        return np.ones_like(d)
+
+    # Accumulate squares of the base for each bit of the power
+    d_n = None
+    while n > 0:
+        if n & 1:
+            d_n = d if d_n is None else d_n * d
+
+        n >>= 1
+        if n > 0:
+            d = d * d
+
+    return d_n
+
+
 def expected_value(
     x: np.ndarray, px: np.ndarray, dx: float | np.ndarray
 ) -> float:
@@ -54,7 +86,11 @@ def expected_value(
             px - np.ndarray, relative probabilities of X
             dx - float or np.ndarray, change in x
     """
-    return np.sum(x * px * dx)
+    # Single change in x - factor it out of the sum
+    if np.ndim(dx) == 0:
+        return dx * np.dot(x, px)
+
+    return np.dot(x * px, dx)
 
 
 def compute_raw_moment(
@@ -73,7 +109,7 @@ def compute_raw_moment(
             n - int, moment
     Returns theta_n - float, raw moment
     """
-    theta_n = np.sum(x**n * px * dx)
+    theta_n = expected_value(x**n, px, dx)
 
     return theta_n
 
@@ -95,7 +131,7 @@ def compute_central_moment(
     mu = expected_value(x, px, dx)
 
     # Compute central moment
-    mu_n = expected_value((x - mu)**n, px, dx)
+    mu_n = expected_value(integer_power(x - mu, n), px, dx)
 
     return mu_n
 
@@ -117,9 +153,12 @@ def compute_standardized_moment(
     # Compute mean
     mu = expected_value(x, px, dx)
 
+    # Deviations from the mean
+    dev = x - mu
+
     # Compute central moment
-    mu_std_n = expected_value((x - mu)**n, px, dx) \
-            / expected_value((x - mu)**2, px, dx)**(n/2)
+    mu_std_n = expected_value(integer_power(dev, n), px, dx) \
+            / expected_value(dev * dev, px, dx)**(n/2)
 
     return mu_std_n
 
@@ -146,6 +185,37 @@ def pdf_mean(pdf: PDF) -> float:
     return mu
 
 
+def pdf_means(pdfs: list[PDF]) -> np.ndarray:
+    """Compute the means of multiple PDFs.
+    If all PDFs are sampled over the same value array, the expected values
+    are computed in a single vectorized pass. Otherwise, the mean of each PDF
+    is computed individually.
+
+    Args    pdfs - list[PDF], PDFs to analyse
+    Returns means - np.ndarray, mean of each PDF
+    """
+    # Escape if no PDFs provided
+    if len(pdfs) == 0:
+        return np.empty(0)
+
+    # Common value array
+    x = pdfs[0].x
+
+    # Compute means individually if value arrays differ
+    if not all(np.array_equal(pdf.x, x) for pdf in pdfs[1:]):
+        return np.array([pdf_mean(pdf) for pdf in pdfs])
+
+    # Change in x
+    dx = value_arrays.sample_spacing_array_from_pdf(pdfs[0])
+
+    # Stack probability densities and compute expected values - one
+    # matrix-vector product, without forming an (n PDFs x n values) product
+    PX = np.stack([pdf.px for pdf in pdfs])
+    means = PX @ (x * dx)
+
+    return means
+
+
 def pdf_variance(pdf: PDF) -> float:
     """Compute the variance of a PDF.
 
@@ -161,7 +231,8 @@ def pdf_variance(pdf: PDF) -> float:
     mu = pdf_mean(pdf)
 
     # Compute variance
-    sigma2 = np.sum((pdf.x - mu)**2 * pdf.px * dx)
+    dev = pdf.x - mu
+    sigma2 = expected_value(dev * dev, pdf.px, dx)
 
     return sigma2
 
@@ -222,13 +293,58 @@ def pdf_kurtosis(pdf: PDF) -> float:
     return kappa
 
 
+def pdf_moments(pdf: PDF) -> tuple[float, float, float, float]:
+    """Compute the mean, variance, skewness, and kurtosis of a PDF together.
+    The sample spacing, weights, and deviations from the mean are formed
+    once and shared by all four moments.
+
+    Args    pdf - PDF to analyse
+    Returns mu - float, mean of PDF
+            sigma2 - float, variance of PDF
+            gamma - float, skewness of PDF
+            kappa - float, kurtosis of PDF
+    """
+    # Change in x
+    dx = value_arrays.sample_spacing_array_from_pdf(pdf)
+
+    # Probability weights
+    w = pdf.px * dx
+
+    # Compute expected value - weighted sums as dot products, which
+    # accumulate without forming the product arrays
+    mu = np.dot(pdf.x, w)
+
+    # Deviations from the mean
+    dev = pdf.x - mu
+
+    # Compute central moments - the weights are scaled by the deviations in
+    # place, so each higher moment reuses the same buffer
+    w *= dev
+    w *= dev
+    sigma2 = w.sum()
+    w *= dev
+    mu_3 = w.sum()
+    w *= dev
+    mu_4 = w.sum()
+
+    # Standardize third and fourth moments
+    gamma = mu_3 / sigma2**1.5
+    kappa = mu_4 / sigma2**2
+
+    return mu, sigma2, gamma, kappa
+
+
 def pdf_mode(pdf: PDF) -> float:
     """Determine the mode (peak value) of a PDF.
 
+    If several values share the peak probability density, the mode is their
+    mean.
+
     Args    pdf - PDF to analyse
     Returns mode - float, mode of PDF
     """
-    return np.mean(pdf.x[pdf.px == pdf.px.max()])
+    # Mean of the values at the peak - the peak is cached on the PDF
+    return np.mean(pdf.x[pdf.px == pdf.px_max])
 
 
 def pdf_median(pdf: PDF) -> float:
@@ -284,17 +400,20 @@ class PDFstatistics:
 def compute_pdf_statistics(pdf: PDF, verbose: bool = False) -> PDFstatistics:
     """Compute the basic statistical properties of a PDF.
     """
+    # Compute moments together
+    mu, sigma2, gamma, kappa = pdf_moments(pdf)
+
     # Compute statistics and package as PDFstatistics object
     pdf_stats = PDFstatistics(
         # Value statistics
         mode=pdf_mode(pdf),
         median=pdf_median(pdf),
         # Moments
-        mean=pdf_mean(pdf),
-        std=pdf_std(pdf),
-        variance=pdf_variance(pdf),
-        skewness=pdf_skewness(pdf),
-        kurtosis=pdf_kurtosis(pdf),
+        mean=mu,
+        std=np.sqrt(sigma2),
+        variance=sigma2,
+        skewness=gamma,
+        kurtosis=kappa,
         # Metadata
         name=pdf.name,
         variable_type=pdf.variable_type,
@@ -361,8 +480,8 @@ def compute_interquantile_range(
     lower = 0.5 - half_confidence
     upper = 0.5 + half_confidence
 
-    # Compute the CDF value for each confidence level
-    values = (pdf.pit(lower), pdf.pit(upper))
+    # Compute the CDF value for both confidence levels in a single inversion
+    values = tuple(pdf.pit(np.array([lower, upper])))
 
     # Format values into ConfidenceRange object
     conf_range = ConfidenceRange(
@@ -386,59 +505,32 @@ def compute_highest_posterior_density(
             confidence - list[float], confidence levels
     Returns conf_range - ConfidenceRange
     """
-    # Value index numbers
-    val_nbs = np.array([*range(len(pdf))])
-
     # Compute probabilities
     dx = value_arrays.sample_spacing_array_from_pdf(pdf)
     p_i = pdf.px * dx
 
-    # Sort the probabilities from largest to smallest
-    sort_ndx = np.argsort(p_i)
-    sort_ndx = sort_ndx[::-1]
-
-    vals_sort = val_nbs[sort_ndx]
-    x_sort = pdf.x[sort_ndx]
-    px_sort = pdf.px[sort_ndx]
-    p_i_sort = p_i[sort_ndx]
-
-    # Sum probabilities until they reach the specified confidence limit
-    P_sort = np.cumsum(p_i_sort)
-
-    # Determine which values meet confidence bounds
-    conf_ndxs = (P_sort <= confidence)
-
-    # Keep x, px value probability pairs that are within confidence limits
-    x_sort_conf = x_sort[conf_ndxs]
-    px_sort_conf = px_sort[conf_ndxs]
-    vals_sort_conf = vals_sort[conf_ndxs]
-
-    # Un-sort values in confidence limit by x-value
-    unsort_ndx = np.argsort(x_sort_conf)
-
-    x_conf = x_sort_conf[unsort_ndx]
-    px_conf = px_sort_conf[unsort_ndx]
-    vals_conf = vals_sort_conf[unsort_ndx]
-
-    # Number of values in confidence limit
-    n_conf = len(x_conf)
-
-    # Group values by continuity
-    clusters = []
-    cluster_start = x_conf[0]
-    for i in range(1, n_conf):
-        if (
-            (vals_conf[i] - vals_conf[i-1]) > 1
-            or (i == n_conf-1)
-        ):
-            # Cluster end
-            cluster_end = x_conf[i-1]
-
-            # Record cluster
-            clusters.append((cluster_start, cluster_end))
-
-            # Start next cluster
-            cluster_start = x_conf[i]
+    # Sum probabilities from largest to smallest and count how many are
+    # needed to reach the specified confidence limit
+    p_desc = np.sort(p_i)[::-1]
+    n_conf = np.searchsorted(np.cumsum(p_desc), confidence, side="right")
+
+    # Keep values above the smallest retained probability, then fill up to
+    # n_conf values from those tied at that threshold, in x-order
+    threshold = p_desc[n_conf - 1] if n_conf > 0 else np.inf
+    keep = (p_i > threshold)
+    ties = np.flatnonzero(p_i == threshold)
+    keep[ties[:n_conf - np.count_nonzero(keep)]] = True
+
+    # Value index numbers and values within confidence limits, in x-order
+    vals_conf = np.flatnonzero(keep)
+    x_conf = pdf.x[vals_conf]
+
+    # Group values by continuity - a cluster breaks wherever consecutive
+    # value index numbers are not adjacent
+    breaks = np.flatnonzero(np.diff(vals_conf) > 1) + 1
+    cluster_starts = x_conf[np.concatenate(([0], breaks))]
+    cluster_ends = x_conf[np.concatenate((breaks - 1, [len(x_conf) - 1]))]
+    clusters = [*zip(cluster_starts.tolist(), cluster_ends.tolist())]
 
     # Format values into ConfidenceRange object
     conf_range = ConfidenceRange(
@@ -24,6 +24,72 @@ from . import value_arrays
 from .ProbabilityDensityFunction import ProbabilityDensityFunction as PDF
 
 
+#################### BATCHED EVALUATION ####################
+def pdfs_at_value(
+    pdfs: list[PDF],
+    x: np.ndarray,
+    out: np.ndarray | None = None,
+    *,
+    shared_x: bool = False,
+) -> np.ndarray:
+    """Evaluate multiple PDFs along a common value array.
+    Values beyond the domain of each PDF have zero probability density, as
+    in PDF.pdf_at_value.
+    If all PDFs are sampled over the same value array, the interpolation
+    indices and weights are computed once and shared by all PDFs.
+    If that value array is the evaluation array itself, the probability
+    densities are copied directly, without interpolation.
+    Each PDF is written into its row of the output array, so a preallocated
+    array (e.g., single precision) can be filled without a full-size
+    temporary.
+
+    Args    pdfs - list[PDF], PDFs to evaluate
+            x - np.ndarray, values at which to evaluate the PDFs
+            out - np.ndarray, optional (n PDFs x n values) array in which to
+             place the result
+            shared_x - bool, PDFs are known to share one value array, so it
+             need not be compared
+    Returns px - np.ndarray, (n PDFs x n values) probability densities
+    """
+    # Output array
+    if out is None:
+        out = np.empty((len(pdfs), len(x)))
+
+    # Common value array
+    x0 = pdfs[0].x
+
+    # Evaluate PDFs individually if value arrays differ
+    if not shared_x and not all(
+        np.array_equal(pdf.x, x0) for pdf in pdfs[1:]
+    ):
+        for i, pdf in enumerate(pdfs):
+            out[i] = pdf.pdf_at_value(x)
+        return out
+
+    # No interpolation needed if PDFs are sampled at the requested values
+    if np.array_equal(x, x0):
+        for i, pdf in enumerate(pdfs):
+            out[i] = pdf.px
+        return out
+
+    # Indices of the samples bracketing each value
+    ndx = np.searchsorted(x0, x, side="right")
+    ndx = np.clip(ndx, 1, len(x0) - 1)
+
+    # Linear interpolation weights
+    w = (x - x0[ndx-1]) / (x0[ndx] - x0[ndx-1])
+    w0 = 1 - w
+
+    # Interpolate each PDF with the shared indices and weights
+    for i, pdf in enumerate(pdfs):
+        out[i] = pdf.px[ndx-1] * w0 + pdf.px[ndx] * w
+
+    # Zero probability density outside the domain
+    out[:,(x < x0[0]) | (x > x0[-1])] = 0.0
+
+    return out
+
+
 #################### RESAMPLING/INTERPOLATION ####################
 def interpolate_pdf(pdf: PDF, x: np.ndarray, verbose: bool = False) -> PDF:
     """Resample a PDF along a new value array.
@@ -39,10 +105,9 @@ def interpolate_pdf(pdf: PDF, x: np.ndarray, verbose: bool = False) -> PDF:
     px_resamp = np.interp(x, pdf.x, pdf.px, left=0, right=0)
 
     # Copy metadata from original PDF
-    metadata = {}
-    for meta_item in pdf.metadata_items:
-        # Retrieve metadata value from original PDF
-        metadata[meta_item] = getattr(pdf, meta_item)
+    metadata = {
+        meta_item: getattr(pdf, meta_item) for meta_item in pdf.metadata_items
+    }
 
     # Instantiate new, resampled PDF
     pdf_resamp = PDF(x, px_resamp, **metadata)
@@ -68,8 +133,33 @@ def interpolate_pdfs(pdfs: list[PDF], verbose: bool = False) -> list[PDF]:
         xmin, xmax, dx, verbose=verbose
     )
 
+    # Lock the value array, so the resampled PDFs share it rather than each
+    # keeping a copy
+    x.setflags(write=False)
+
+    # Group PDFs that share a value array, so the interpolation indices and
+    # weights are computed once per group
+    groups = {}
+    for i, pdf in enumerate(pdfs):
+        groups.setdefault(id(pdf.x), []).append(i)
+
     # Resample PDFs
-    pdfs_resamp = [interpolate_pdf(pdf, x) for pdf in pdfs]
+    pdfs_resamp = [None] * len(pdfs)
+    for ndxs in groups.values():
+        # PDFs with their own value array - a single interpolation call
+        if len(ndxs) == 1:
+            pdfs_resamp[ndxs[0]] = interpolate_pdf(pdfs[ndxs[0]], x)
+            continue
+
+        # PDFs sharing a value array - common indices and weights
+        PX = pdfs_at_value([pdfs[i] for i in ndxs], x, shared_x=True)
+
+        for i, px_resamp in zip(ndxs, PX):
+            metadata = {
+                meta_item: getattr(pdfs[i], meta_item)
+                for meta_item in pdfs[i].metadata_items
+            }
+            pdfs_resamp[i] = PDF(x, px_resamp, **metadata)
 
     return pdfs_resamp
 
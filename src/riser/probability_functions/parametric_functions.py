@@ -26,6 +26,14 @@ import scipy as sp
 from .. import integration
 
 
+# Constants
+INV_SQRT_2PI = 1 / np.sqrt(2 * np.pi)
+
+# Number of standard deviations beyond which the Gaussian density underflows
+# to zero in double precision
+GAUSSIAN_SUPPORT = 39
+
+
 #################### SUPPORT FUNCTIONS ####################
 def check_mass_against_value_range(x: np.ndarray, xmin: float, xmax: float):
     """Check that the xmin and xmax values of the PDF lie within the value
@@ -42,18 +50,11 @@ def boxcar(x: np.ndarray, xmin: float, xmax: float) -> np.ndarray:
     # Checks
     check_mass_against_value_range(x, xmin, xmax)
 
-    # Number of data points
-    n = len(x)
-
-    # Initialize probability values
-    px = np.zeros(n)
-
     # Probability density values
-    boxcar_ndx = (x > xmin) & (x < xmax)
-    px[boxcar_ndx] = 1.0
+    px = ((x > xmin) & (x < xmax)).astype(float)
 
     # Normalize area
-    px /= np.sum(px)
+    px *= 1 / np.sum(px)
 
     return px
 
@@ -66,30 +67,12 @@ def triangular(
     # Checks
     check_mass_against_value_range(x, xmin, xmax)
 
-    # Number of data points
-    n = len(x)
-
-    # Initialize probability values
-    px = np.zeros(n)
-
-    # Left side
-    m = 1 / (xmode - xmin)
-    b = 1 - m * xmode
-    left_ndx = (x >= xmin) & (x < xmode)
-    px[left_ndx] = m * x[left_ndx] + b
-
-    # Peak
-    peak_ndx = (x >= xmode) & (x <= xmode)
-    px[peak_ndx] = 1.0
-
-    # Right side
-    m = -1 / (xmax - xmode)
-    b = 0 - m * xmax
-    right_ndx = (x > xmode) & (x <= xmax)
-    px[right_ndx] = m * x[right_ndx] + b
+    # Rising and falling sides, each reaching 1.0 at the mode
+    left = (x - xmin) * (1 / (xmode - xmin))
+    right = (xmax - x) * (1 / (xmax - xmode))
 
-    # Ensure all values > 0 (rounding error)
-    px[px < 0] = 0
+    # Lower of the two sides, limited to [0, 1] - zero beyond the limits
+    px = np.clip(np.minimum(left, right), 0, 1)
 
     # Normalize area
     px /= integration.integrate(x=x, px=px)
@@ -105,27 +88,13 @@ def trapezoidal(
     # Checks
     check_mass_against_value_range(x, x1, x4)
 
-    # Number of data points
-    n = len(x)
+    # Rising and falling sides, each reaching 1.0 at the plateau
+    left = (x - x1) * (1 / (x2 - x1))
+    right = (x4 - x) * (1 / (x4 - x3))
 
-    # Initialize probability values
-    px = np.zeros(n)
-
-    # Left side
-    m = 1 / (x2 - x1)
-    b = 1 - m * x2
-    left_ndx = (x > x1) * (x < x2)
-    px[left_ndx] = m * x[left_ndx] + b
-
-    # Boxcar
-    boxcar_ndx = (x >= x2) * (x <= x3)
-    px[boxcar_ndx] = 1.0
-
-    # Right side
-    m = -1 / (x4 - x3)
-    b = 0 - m * x4
-    right_ndx = (x > x3) & (x < x4)
-    px[right_ndx] = m * x[right_ndx] + b
+    # Lower of the two sides, limited to [0, 1] - flat between x2 and x3,
+    # zero beyond the limits
+    px = np.clip(np.minimum(left, right), 0, 1)
 
     # Normalize area
     px /= integration.integrate(x=x, px=px)
@@ -135,15 +104,38 @@ def trapezoidal(
 
 def gaussian(x: np.ndarray, mu: float, sigma: float) -> np.ndarray:
     """Gaussian function with unit area.
+    If the values increase monotonically, as for a PDF value array, the
+    density is evaluated only within its numerical support; otherwise it is
+    evaluated at every value.
     """
     # Checks
     check_mass_against_value_range(x, mu - 4 * sigma, mu + 4 * sigma)
 
-    a = 1 / (sigma * np.sqrt(2 * np.pi))
-    f = np.exp(-0.5 * (x - mu)**2 / sigma**2)
+    # Scaling
+    inv_sigma = 1 / sigma
+    a = INV_SQRT_2PI * inv_sigma
+
+    # Evaluate sorted values within the support only
+    if x.ndim == 1 and np.all(x[1:] >= x[:-1]):
+        # Indices of the values within the support
+        i0, i1 = np.searchsorted(
+            x, [mu - GAUSSIAN_SUPPORT * sigma, mu + GAUSSIAN_SUPPORT * sigma]
+        )
+
+        # Standardized values
+        z = (x[i0:i1] - mu) * inv_sigma
+
+        # Probability density
+        px = np.zeros(len(x))
+        px[i0:i1] = a * np.exp(-0.5 * z * z)
+
+        return px
+
+    # Standardized values
+    z = (x - mu) * inv_sigma
 
     # Probability density
-    px = a * f
+    px = a * np.exp(-0.5 * z * z)
 
     return px
 
@@ -151,7 +143,7 @@ def gaussian(x: np.ndarray, mu: float, sigma: float) -> np.ndarray:
 def cumulative_gaussian(x: np.ndarray, mu: float, sigma: float) -> np.ndarray:
     """Cumulative Gaussian function with unit area.
     """
-    return 0.5 + 0.5 * sp.special.erf((x - mu) / (np.sqrt(2) * sigma))
+    return sp.special.ndtr((x - mu) / sigma)
 
 
 #################### FUNCTION RETRIEVAL ####################
@@ -33,15 +33,15 @@ def sample_spacing_from_pdf(pdf: PDF, verbose: bool = False) -> float:
     Args    pdf - PDF from which to determine sample spacing
     Returns dx - float, sample spacing (single value)
     """
-    # Deteremine differences between x-samples
-    diff_x = np.diff(pdf.x)
+    # Differences between x-samples, recorded on the PDF
+    diff_x = pdf.dx
 
-    # Determine regularity of sampling
-    diff_x_std = np.std(diff_x)
+    # Determine regularity of sampling - range of spacings
+    diff_x_range = np.ptp(diff_x)
 
     # Raise warning if a single value is not representative
-    if diff_x_std > precision.RISER_PRECISION:
-        warnings.warn(f"Sample spacing varies by {diff_x_std}. "
+    if diff_x_range > precision.spacing_tolerance(diff_x):
+        warnings.warn(f"Sample spacing varies by {diff_x_range}. "
                       f"A single value might not be representative.")
 
     # Representative spacing value
@@ -71,28 +71,16 @@ def sample_spacing_array_from_pdf(
     bin size will be zero (excluding the final measurement).
 
     Args    pdf - PDF for which to determine dx
-    Returns dx - np.ndarray
+    Returns dx - np.ndarray, read-only, computed once per PDF
     """
-    # Deteremine differences between x-samples
-    diff_x = np.diff(pdf.x)
-
-    # Determine regularity of sampling
-    diff_x_std = np.std(diff_x)
-
     # Report if requested
     if verbose:
-        print(f"Sample spacing mean {np.mean(diff_x)}, std {diff_x_std}")
-
-    # Check regularity against machine error
-    if diff_x_std > precision.RISER_PRECISION:
-        # Irregular sampling of PDF
-        return precision.fix_precision(np.diff(pdf.x, append=0))
-    else:
-        # Regular sampling
-        return precision.fix_precision(
-            np.diff(pdf.x, append=pdf.x[-1] + np.mean(diff_x))
+        print(
+            f"Sample spacing mean {np.mean(pdf.dx)}, std {np.std(pdf.dx)}"
         )
 
+    return pdf.bin_widths
+
 
 def value_array_params_from_pdfs(
     pdfs: list[PDF], verbose: bool = False
@@ -156,9 +156,12 @@ def sample_monte_carlo(
     # Number of markers
     m_markers = len(markers)
 
-    # Initialize sample arrays
-    age_samps = np.empty(m_markers)
-    disp_samps = np.empty(m_markers)
+    # Marker PDFs, in marker order
+    age_pdfs = [marker.age for marker in markers.values()]
+    disp_pdfs = [marker.displacement for marker in markers.values()]
+
+    # Number of trials to draw and transform at once
+    batch_size = min(n_samples, hard_stop)
 
     # Initialize output arrays
     age_picks = np.empty((m_markers, n_samples))
@@ -176,14 +179,27 @@ def sample_monte_carlo(
 
     # Loop through samples until enough successess collected
     for i in range(hard_stop):
-        # Generate random numbers over interval [0.0, 1.0)
-        r_ages = np.random.rand(m_markers)
-        r_disps = np.random.rand(m_markers)
-
-        # Transform random numbers to age, displacement values
-        for j, name in enumerate(markers.keys()):
-            age_samps[j] = markers[name].age.pit(r_ages[j])
-            disp_samps[j] = markers[name].displacement.pit(r_disps[j])
+        # Draw and transform a new batch of trials when needed
+        k = i % batch_size
+        if k == 0:
+            # Generate random numbers over interval [0.0, 1.0)
+            # Drawn in the same order as one trial at a time: ages, then
+            # displacements, for each trial
+            n_batch = min(batch_size, hard_stop - i)
+            r_vals = np.random.rand(n_batch, 2, m_markers)
+
+            # Transform random numbers to age, displacement values - one
+            # inverse transform per marker for the whole batch
+            age_batch = np.column_stack(
+                [pdf.pit(r_vals[:,0,j]) for j, pdf in enumerate(age_pdfs)]
+            )
+            disp_batch = np.column_stack(
+                [pdf.pit(r_vals[:,1,j]) for j, pdf in enumerate(disp_pdfs)]
+            )
+
+        # Samples for this trial
+        age_samps = age_batch[k]
+        disp_samps = disp_batch[k]
 
         # Check samples against condition
         if criterion.check_pass_fail(age_samps, disp_samps):
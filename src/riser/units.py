@@ -151,7 +151,7 @@ def scale_values_by_units(
     # Check if compound unit
     operators = [".", "/"]
     if any(
-        [char in unit for unit in [unit_in, unit_out] for char in operators]
+        char in unit for unit in [unit_in, unit_out] for char in operators
     ):
         raise ValueError("Compound units not currently supported")
 
@@ -180,7 +180,7 @@ def scale_pdf_by_units(
     (e.g., m/y).
     """
     # Escape if units not properly specified or scaling is not desired
-    if any([pdf.unit is None, unit_out is None]):
+    if pdf.unit is None or unit_out is None:
         if pdf.unit is None:
             warnings.warn(
                 "Cannot scale PDF values with units None. "
@@ -425,7 +425,7 @@ def multiply_variables(
     x1_abs = np.abs(pdf1.x)
 
     # Non-zero index
-    nonzero_ndx = (x1_abs > 10**-precision.RISER_PRECISION)
+    nonzero_ndx = (x1_abs > precision.RISER_TOLERANCE)
 
     # Non-zero values and probability densities of pdf1
     x1_nonzero = pdf1.x[nonzero_ndx]
@@ -0,0 +1,50 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Rob Zinke
+# (c) 2025 all rights reserved
+
+
+# Driver
+def test():
+    """Ordering check: the Gaussian function gives the same densities for
+    unsorted values as for the same values in sorted order.
+    """
+    # Import modules
+    import warnings
+
+    import numpy as np
+
+    from riser import probability_functions as PDFs
+
+    # Unsorted values, spanning well beyond the support
+    x = np.array([10.0, 0.0, -10.0, 0.05])
+
+    # Evaluate unsorted and sorted values
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        px = PDFs.parametric_functions.gaussian(x, 0.0, 0.1)
+
+        sort_ndx = np.argsort(x)
+        px_sorted = PDFs.parametric_functions.gaussian(x[sort_ndx], 0.0, 0.1)
+
+    # Check densities agree, including the peak at the mean
+    if not np.allclose(px[sort_ndx], px_sorted) or not np.isclose(
+        px[1], 1 / np.sqrt(2 * np.pi * 0.1**2)
+    ):
+        print(f"Unsorted densities {px} do not match sorted {px_sorted}")
+        return 1
+
+    return 0
+
+
+# Bootstrap
+if __name__ == "__main__":
+    # Invoke the driver
+    status = test()
+
+    # Share the status with the shell
+    raise SystemExit(status)
+
+
+# end of file
@@ -0,0 +1,55 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Rob Zinke
+# (c) 2025 all rights reserved
+
+
+# Driver
+def test(fname: str):
+    """Regularity check: a PDF saved on a regular grid whose values are
+    rounded to the library precision (e.g., slip rate grids starting at
+    1/1100) keeps uniform bin widths when read back, and does not warn about
+    varying sample spacing.
+    """
+    # Import modules
+    import warnings
+
+    import numpy as np
+
+    from riser import precision
+    from riser import probability_functions as PDFs
+
+    # Regular grid with rounding jitter in the spacing
+    x = precision.fix_precision(np.linspace(1 / 1100, 10, 1001))
+    px = PDFs.parametric_functions.gaussian(x, 5.0, 1.0)
+
+    # Save and read back PDF, turning warnings into errors
+    PDFs.readers.save_pdf(fname, PDFs.PDF(x, px, name="rate"))
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        pdf = PDFs.readers.read_pdf(fname)
+
+        # Representative sample spacing
+        PDFs.value_arrays.sample_spacing_from_pdf(pdf)
+
+    # Check bin widths are uniform to within rounding, including the final bin
+    widths_range = np.ptp(pdf.bin_widths)
+    if widths_range > precision.spacing_tolerance(pdf.dx):
+        print(f"Bin widths vary by {widths_range}")
+        return 1
+
+    return 0
+
+
+# Bootstrap
+if __name__ == "__main__":
+    # Invoke the driver
+    status = test("tmp/regular_spacing.txt")
+
+    # Share the status with the shell
+    raise SystemExit(status)
+
+
+# end of file
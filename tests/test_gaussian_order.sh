@@ -0,0 +1,5 @@
+#!/bin/bash
+
+
+# Check that the Gaussian function handles unsorted values
+python3 gaussian_order.py
@@ -0,0 +1,5 @@
+#!/bin/bash
+
+
+# Check that a rounded, regularly sampled PDF is recognized as regular
+python3 regular_spacing.py